@@ -153,6 +153,7 @@ from ._utils import (
     in_micros,
     non_zero,
     wait_for_connection,
+    wait_for_connection_pairs,
 )
 from ._yaml_settings import YamlSettingsProvider
 
@@ -309,6 +310,7 @@ __all__ = [
     "in_micros",
     "make_datakey",
     "wait_for_connection",
+    "wait_for_connection_pairs",
     "Ignore",
     "non_zero",
     # Derived signal
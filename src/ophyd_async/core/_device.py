@@ -2,8 +2,16 @@ from __future__ import annotations
 
 import asyncio
 import sys
-from collections.abc import Awaitable, Callable, Iterator, Mapping, MutableMapping
+from collections.abc import (
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterator,
+    Mapping,
+    MutableMapping,
+)
 from functools import cached_property
+from itertools import chain
 from logging import LoggerAdapter, getLogger
 from typing import Any, Generic, TypeVar
 from unittest.mock import Mock
@@ -14,12 +22,16 @@ from bluesky.run_engine import call_in_bluesky_event_loop, in_bluesky_event_loop
 from ._utils import (
     DEFAULT_TIMEOUT,
     NotConnectedError,
+    _connect_concurrency,
     error_if_none,
-    wait_for_connection,
+    wait_for_connection_pairs,
 )
 
 DeviceT = TypeVar("DeviceT", bound="Device")
 
+# Shared by every Device.log adapter
+_DEVICE_LOGGER = getLogger("ophyd_async.devices")
+
 DEVICE_RESERVED_ATTRS = {
     "name",
     "collect_asset_docs",
@@ -137,8 +149,10 @@ class DeviceConnector:
         if exceptions:
             raise NotConnectedError.with_other_exceptions_logged(exceptions)
 
-        # Call the DeviceMock's connect method to inject custom logic
-        await mock.connect(device)
+        # Call the DeviceMock's connect method to inject custom logic, skipping
+        # the await if it is the default no-op
+        if type(mock).connect is not DeviceMock.connect:
+            await mock.connect(device)
 
     async def connect_real(self, device: Device, timeout: float, force_reconnect: bool):
         """Use during [](#Device.connect) with `mock=False`.
@@ -147,11 +161,14 @@ class DeviceConnector:
         mode. It connects the Device and all its children in real mode in parallel.
         """
         # Connect in parallel, gathering up NotConnectedErrors
-        coros = {
-            name: child_device.connect(timeout=timeout, force_reconnect=force_reconnect)
+        pairs = [
+            (
+                name,
+                child_device.connect(timeout=timeout, force_reconnect=force_reconnect),
+            )
             for name, child_device in device.children()
-        }
-        await wait_for_connection(**coros)
+        ]
+        await wait_for_connection_pairs(pairs)
 
 
 def _fail_if_overwriting_parent(self: Device, name: str, value: Any):
@@ -177,6 +194,16 @@ def _set_device_child(self: Device, name: str, value: Device | None):
     object.__setattr__(self, name, value)
 
 
+def _create_eager_task(coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+    # Run the coroutine up to its first suspension point straight away rather
+    # than waiting a loop iteration, so connects that complete synchronously
+    # don't pay for a trip through the scheduler. Only available on 3.12+
+    if sys.version_info >= (3, 12):
+        loop = asyncio.get_running_loop()
+        return asyncio.Task(coro, loop=loop, eager_start=True)
+    return asyncio.create_task(coro)
+
+
 class Device(HasName):
     """Common base class for all Ophyd Async Devices.
 
@@ -187,8 +214,10 @@ class Device(HasName):
     parent: Device | None = None
     """The parent Device if it exists"""
     _name: str = ""
-    # None if connect hasn't started, a Task if it has
+    # A Task if a real connect is in progress or failed, None otherwise
     _connect_task: asyncio.Task | None = None
+    # True if the last real connect succeeded
+    _connected: bool = False
     # The mock class to be used if we connect in mock mode
     _mock_class: type[DeviceMock] = DeviceMock
     # The mock if we have connected in mock mode
@@ -200,14 +229,9 @@ class Device(HasName):
 
     def __new__(cls, *args, **kwargs):
         self = super().__new__(cls)
-        # These are guaranteed not to be devices, so don't check them
-        setattr_methods = dict.fromkeys(_not_device_attrs, object.__setattr__) | {
-            # parent needs special handling
-            "parent": _fail_if_overwriting_parent,
-        }
         # Assign _setattr_methods in __new__ instead of __init__,
         # as this is called before any __setattr__ calls are made
-        object.__setattr__(self, "_setattr_methods", setattr_methods)
+        object.__setattr__(self, "_setattr_methods", _default_setattr_methods.copy())
         return self
 
     def __init__(
@@ -232,14 +256,14 @@ class Device(HasName):
 
         :yields: `(attr_name, attr)` for each child attribute that is a Device.
         """
-        yield from self._child_devices.items()
+        # _child_devices is kept up to date by __setattr__, so there is no need
+        # to wrap it in a generator
+        return iter(self._child_devices.items())
 
     @cached_property
     def log(self) -> LoggerAdapter:
         """Return a logger configured with the device name."""
-        return LoggerAdapter(
-            getLogger("ophyd_async.devices"), {"ophyd_async_device_name": self.name}
-        )
+        return LoggerAdapter(_DEVICE_LOGGER, {"ophyd_async_device_name": self.name})
 
     def set_name(self, name: str, *, child_name_separator: str | None = None) -> None:
         """Set `self.name=name` and each `self.child.name=name+"-child"`.
@@ -255,13 +279,15 @@ class Device(HasName):
         # Ensure logger is recreated after a name change
         if "log" in self.__dict__:
             del self.log
-        for attr_name, child in self.children():
-            child_name = (
-                f"{self.name}{self._child_name_separator}{attr_name}"
-                if self.name
-                else ""
-            )
-            child.set_name(child_name, child_name_separator=self._child_name_separator)
+        separator = self._child_name_separator
+        if name:
+            prefix = name + separator
+            for attr_name, child in self.children():
+                child.set_name(prefix + attr_name, child_name_separator=separator)
+        else:
+            # Unnamed devices have unnamed children
+            for _, child in self.children():
+                child.set_name("", child_name_separator=separator)
 
     def __setattr__(self, name: str, value: Any) -> None:
         # Bear in mind that this function is called *a lot*, so
@@ -305,11 +331,14 @@ class Device(HasName):
         :param force_reconnect:
             If True, force a reconnect even if the last connect succeeded.
         """
-        connector: DeviceConnector = error_if_none(
-            getattr(self, "_connector", None),
-            f"{self}: doesn't have attribute `_connector`,"
-            f" did you call `super().__init__` in your `__init__` method?",
-        )
+        # Only format the error message if we need it, as this is called for
+        # every Device in the tree
+        connector: DeviceConnector | None = getattr(self, "_connector", None)
+        if connector is None:
+            raise RuntimeError(
+                f"{self}: doesn't have attribute `_connector`,"
+                f" did you call `super().__init__` in your `__init__` method?"
+            )
         if mock:
             # Always connect in mock mode serially
             if isinstance(mock, DeviceMock):
@@ -320,21 +349,46 @@ class Device(HasName):
                 self._mock = self._mock_class()
             await connector.connect_mock(self, self._mock)
         else:
-            # Try to cache the connect in real mode
+            if self._connect_task and self._connect_task.done():
+                # Pick up a success that the done callback hasn't recorded yet
+                self._record_connect_success(self._connect_task)
+            if self._mock is None and self._connected and not force_reconnect:
+                # The last real connect succeeded, so there is nothing to do
+                return
+            # Join a real connect that is still in progress, otherwise start one
             can_use_previous_connect = (
                 self._mock is None
                 and self._connect_task
-                and not (self._connect_task.done() and self._connect_task.exception())
+                and not self._connect_task.done()
             )
             if force_reconnect or not can_use_previous_connect:
+                # Check the concurrency limit before any children start to
+                # connect, so a bad value gives one ValueError, not one per Signal
+                _connect_concurrency()
                 self._mock = None
+                self._connected = False
                 coro = connector.connect_real(self, timeout, force_reconnect)
-                self._connect_task = asyncio.create_task(coro)
+                self._connect_task = _create_eager_task(coro)
+                # Record the success as soon as the Task finishes, so that a
+                # connect() before this caller resumes doesn't start another one
+                self._connect_task.add_done_callback(self._record_connect_success)
             connect_task = error_if_none(
                 self._connect_task, "Connect task not created, this shouldn't happen"
             )
-            # Wait for it to complete
+            # Wait for it to complete, leaving the Task in place if it fails
             await connect_task
+            self._record_connect_success(connect_task)
+
+    def _record_connect_success(self, task: asyncio.Task) -> None:
+        # Only the current Task counts, not one replaced by a forced reconnect
+        if (
+            self._connect_task is task
+            and not task.cancelled()
+            and task.exception() is None
+        ):
+            # Remember the success and drop the finished Task
+            self._connected = True
+            self._connect_task = None
 
 
 _not_device_attrs = {
@@ -344,8 +398,18 @@ _not_device_attrs = {
     "_timeout",
     "_mock",
     "_connect_task",
+    "_connected",
     "_child_name_separator",
     "_attempts",
+    "_child_cache",
+}
+
+# Copied for each new Device, so only needs building once
+_default_setattr_methods: dict[str, Callable[[Device, str, Any], None]] = {
+    # These are guaranteed not to be devices, so don't check them
+    **dict.fromkeys(_not_device_attrs, object.__setattr__),
+    # parent needs special handling
+    "parent": _fail_if_overwriting_parent,
 }
 
 
@@ -355,6 +419,9 @@ class DeviceVector(MutableMapping[int, DeviceT], Device):
     :see-also: [](#implementing-devices) for examples of how to use this class.
     """
 
+    # Cached `(str(key), child)` pairs, None if children have changed since
+    _child_cache: list[tuple[str, Device]] | None = None
+
     def __init__(
         self,
         children: Mapping[int, DeviceT] | None = None,
@@ -378,21 +445,23 @@ class DeviceVector(MutableMapping[int, DeviceT], Device):
             msg = f"Expected Device, got {value}"
             raise TypeError(msg)
         self._children[key] = value
+        self._child_cache = None
         value.parent = self
 
     def __delitem__(self, key: int) -> None:
         del self._children[key]
+        self._child_cache = None
 
     def __iter__(self) -> Iterator[int]:
-        yield from self._children
+        return iter(self._children)
 
     def __len__(self) -> int:
         return len(self._children)
 
     def children(self) -> Iterator[tuple[str, Device]]:
-        for key, child in self._children.items():
-            yield str(key), child
-        yield from super().children()
+        if self._child_cache is None:
+            self._child_cache = [(str(k), v) for k, v in self._children.items()]
+        return chain(self._child_cache, super().children())
 
     def __hash__(self):  # to allow DeviceVector to be used as dict keys and in sets
         return hash(id(self))
@@ -411,24 +480,16 @@ class DeviceProcessor:
 
     def _caller_locals(self) -> dict[str, Any]:
         """Walk up until we find a stack frame that doesn't have us as self."""
-        try:
-            raise ValueError
-        except ValueError:
-            _, _, tb = sys.exc_info()
-            tb = error_if_none(tb, "Can't get traceback, this shouldn't happen")
-
-            caller_frame = tb.tb_frame
-            while caller_frame.f_locals.get("self", None) is self:
-                caller_frame = caller_frame.f_back
-                if not caller_frame:
-                    msg = (
-                        "No previous frame to the one with self in it, "
-                        "this shouldn't happen"
-                    )
-                    raise RuntimeError(  # noqa: B904
-                        msg
-                    )
-            return caller_frame.f_locals.copy()
+        caller_frame = sys._getframe(1)  # noqa: SLF001
+        while caller_frame.f_locals.get("self", None) is self:
+            caller_frame = caller_frame.f_back
+            if not caller_frame:
+                msg = (
+                    "No previous frame to the one with self in it, "
+                    "this shouldn't happen"
+                )
+                raise RuntimeError(msg)
+        return caller_frame.f_locals.copy()
 
     def __enter__(self) -> DeviceProcessor:
         # Stash the names that were defined before we were called
@@ -439,8 +500,7 @@ class DeviceProcessor:
         return self.__enter__()
 
     async def __aexit__(self, type, value, traceback):
-        self._locals_on_exit = self._caller_locals()
-        await self._on_exit()
+        await self._arun_finalize()
 
     def __exit__(self, type_, value, traceback):
         if in_bluesky_event_loop():
@@ -448,7 +508,7 @@ class DeviceProcessor:
                 "Cannot use DeviceConnector inside a plan, instead use "
                 "`yield from ophyd_async.plan_stubs.ensure_connected(device)`"
             )
-        self._locals_on_exit = self._caller_locals()
+        self._finalize()
         try:
             fut = call_in_bluesky_event_loop(self._on_exit())
         except RuntimeError as exc:
@@ -459,12 +519,22 @@ class DeviceProcessor:
             ) from exc
         return fut
 
+    def _finalize(self) -> None:
+        # Stash the names that are defined as we exit
+        self._locals_on_exit = self._caller_locals()
+
+    async def _arun_finalize(self) -> None:
+        self._finalize()
+        await self._on_exit()
+
     async def _on_exit(self) -> None:
-        # Find all the devices
+        # Find all the devices that are new or rebound since we entered, in a
+        # single pass over the caller's locals
+        locals_on_enter = self._locals_on_enter
         devices = {
             name: obj
             for name, obj in self._locals_on_exit.items()
-            if isinstance(obj, Device) and self._locals_on_enter.get(name) is not obj
+            if isinstance(obj, Device) and locals_on_enter.get(name) is not obj
         }
         # Call the provided process function on them
         await self._process_devices(devices)
@@ -507,10 +577,14 @@ def init_devices(
                 if not device.name:
                     device.set_name(name, child_name_separator=child_name_separator)
         if connect:
-            coros = {
-                name: device.connect(mock, timeout) for name, device in devices.items()
-            }
-            await wait_for_connection(**coros)
+            if not mock:
+                # As in Device.connect, check this before any Device connects
+                _connect_concurrency()
+            pairs = [
+                (name, device.connect(mock, timeout))
+                for name, device in devices.items()
+            ]
+            await wait_for_connection_pairs(pairs)
 
     return DeviceProcessor(process_devices)
 
@@ -8,6 +8,7 @@ import time
 import warnings
 from collections.abc import AsyncGenerator, Callable
 from typing import Any, Generic, TypeVar, cast
+from weakref import WeakKeyDictionary
 
 from bluesky.protocols import (
     Configurable,
@@ -32,6 +33,7 @@ from ._utils import (
     DEFAULT_TIMEOUT,
     CalculatableTimeout,
     Callback,
+    _connect_concurrency,
     _wait_for,
     error_if_none,
 )
@@ -45,6 +47,23 @@ def _add_timeout(func):
     return wrapper
 
 
+# Per event loop (limit, semaphore) used to cap concurrent Signal connects
+_connect_semaphores: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, tuple[int, asyncio.Semaphore]
+] = WeakKeyDictionary()
+
+
+def _connect_semaphore() -> asyncio.Semaphore | None:
+    limit = _connect_concurrency()
+    if limit is None:
+        return None
+    loop = asyncio.get_running_loop()
+    existing = _connect_semaphores.get(loop)
+    if existing is None or existing[0] != limit:
+        existing = _connect_semaphores[loop] = (limit, asyncio.Semaphore(limit))
+    return existing[1]
+
+
 class SignalConnector(DeviceConnector):
     """Used for connecting signals with a given backend."""
 
@@ -56,8 +75,13 @@ class SignalConnector(DeviceConnector):
 
     async def connect_real(self, device: Device, timeout: float, force_reconnect: bool):
         self.backend = self._init_backend
-        device.log.debug(f"Connecting to {self.backend.source(device.name, read=True)}")
-        await self.backend.connect(timeout)
+        # Only gate the leaf connects, as parents waiting on their children
+        # while holding a place would deadlock
+        async with _connect_semaphore() or contextlib.nullcontext():
+            device.log.debug(
+                f"Connecting to {self.backend.source(device.name, read=True)}"
+            )
+            await self.backend.connect(timeout)
 
 
 class _ChildrenNotAllowed(dict[str, Device]):
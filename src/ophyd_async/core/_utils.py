@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 from collections.abc import Awaitable, Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from enum import Enum, EnumMeta, StrEnum
@@ -189,18 +190,29 @@ async def wait_for_connection(**coros: Awaitable[None]):
 
     Expected kwargs should be a mapping of names to coroutine tasks to execute.
     """
+    await wait_for_connection_pairs(list(coros.items()))
+
+
+async def wait_for_connection_pairs(pairs: Sequence[tuple[str, Awaitable[None]]]):
+    """Like `wait_for_connection`, but taking a sequence of `(name, coro)` pairs.
+
+    Use this when the names and coroutines are already being produced together,
+    to avoid building and splatting an intermediate dict.
+    """
     exceptions: dict[str, Exception] = {}
-    if len(coros) == 1:
+    if len(pairs) == 1:
         # Single device optimization
-        name, coro = coros.popitem()
+        ((name, coro),) = pairs
         try:
             await coro
         except Exception as exc:
             exceptions[name] = exc
     else:
         # Use gather to connect in parallel
-        results = await asyncio.gather(*coros.values(), return_exceptions=True)
-        for name, result in zip(coros, results, strict=False):
+        results = await asyncio.gather(
+            *(coro for _, coro in pairs), return_exceptions=True
+        )
+        for (name, _), result in zip(pairs, results, strict=True):
             if isinstance(result, Exception):
                 exceptions[name] = result
 
@@ -208,6 +220,27 @@ async def wait_for_connection(**coros: Awaitable[None]):
         raise NotConnectedError.with_other_exceptions_logged(exceptions)
 
 
+@lru_cache(maxsize=8)
+def _parse_connect_concurrency(limit_str: str) -> int | None:
+    if not limit_str:
+        return None
+    limit = int(limit_str) if limit_str.isdigit() else 0
+    if limit < 1:
+        raise ValueError(
+            "OPHYD_ASYNC_CONNECT_CONCURRENCY should be a positive integer, "
+            f"got {limit_str!r}"
+        )
+    return limit
+
+
+def _connect_concurrency() -> int | None:
+    # Read the environment each time so it can be changed at runtime, but only
+    # parse each distinct value once, as this is called for every Signal connect
+    return _parse_connect_concurrency(
+        os.environ.get("OPHYD_ASYNC_CONNECT_CONCURRENCY", "")
+    )
+
+
 # Cache get_type_hints calls to avoid expensive introspection across the codebase
 @lru_cache(maxsize=512)
 def cached_get_type_hints(cls: type, include_extras: bool = False) -> dict[str, Any]:
@@ -11,7 +11,7 @@ from ._devices import (
     EpicsTestSupersetEnum,
     EpicsTestTable,
 )
-from ._launch import generate_random_pv_prefix, start_ioc
+from ._launch import IOC_READY_MARKER, generate_random_pv_prefix, start_ioc
 from ._pvi_nested_devices import (
     PVI_NESTED_RECORDS,
     EpicsTestPviLeafDevice,
@@ -28,6 +28,7 @@ IOC = Path(__file__).parent / "_ioc.py"
 __all__ = [
     "CA_PVA_RECORDS",
     "IOC",
+    "IOC_READY_MARKER",
     "PVA_RECORDS",
     "PVI_NESTED_RECORDS",
     "EpicsTestCaDevice",
@@ -18,7 +18,8 @@ from pathlib import Path
 
 from ophyd_async.testing import ManagedSubprocess, start_subprocess
 
-_READY_MARKER = "iocRun: All initialization complete"
+#: Line an EPICS IOC prints once it has started and is serving its PVs
+IOC_READY_MARKER = "iocRun: All initialization complete"
 _STOP_INPUT = "exit()"
 
 
@@ -46,4 +47,4 @@ def start_ioc(script: Path, *args: str) -> ManagedSubprocess:
         the script's own `--help`); this function doesn't thread it through.
     """
     subprocess_args = [sys.executable, str(script), *args]
-    return start_subprocess(subprocess_args, _READY_MARKER, stop_input=_STOP_INPUT)
+    return start_subprocess(subprocess_args, IOC_READY_MARKER, stop_input=_STOP_INPUT)
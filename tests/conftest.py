@@ -17,6 +17,7 @@ from ophyd_async.core import (
     StaticFilenameProvider,
     StaticPathProvider,
 )
+from ophyd_async.epics.testing import IOC_READY_MARKER
 
 INCOMPLETE_BLOCK_RECORD = str(
     Path(__file__).parent
@@ -80,8 +81,47 @@ def configure_epics_environment():
     os.environ["EPICS_PVA_AUTO_ADDR_LIST"] = "NO"
 
 
+# asyncio debug mode adds overhead to every task created, so only turn it on
+# when asked to, as CI does
+DEBUG_LOOP = os.getenv("OPHYD_ASYNC_DEBUG_LOOP", "0") == "1"
+
 _ALLOWED_PYTEST_TASKS = {"async_finalizer", "async_setup", "async_teardown"}
 
+# How long to wait for cancelled tasks to finish before reporting them as stuck
+_CANCEL_TIMEOUT = 1.0
+
+
+def _cancel_pending_tasks(loop: asyncio.AbstractEventLoop) -> set[asyncio.Task]:
+    """Cancel the unfinished tasks in the event loop, apart from the current one."""
+    current_task = asyncio.current_task(loop)
+    # all_tasks only returns unfinished tasks, and needs to be used rather than
+    # tracking the tasks ophyd-async creates, as a test can leak any task
+    unfinished_tasks = {
+        task
+        for task in asyncio.all_tasks(loop)
+        if (name := getattr(task.get_coro(), "__name__", None)) is not None
+        and name not in _ALLOWED_PYTEST_TASKS
+        and task is not current_task
+    }
+    for task in unfinished_tasks:
+        task.cancel()
+    return unfinished_tasks
+
+
+async def _wait_for_cancelled_tasks(tasks: set[asyncio.Task]) -> set[asyncio.Task]:
+    """Wait for cancelled tasks to finish, returning any that are still running."""
+    if not tasks:
+        return set()
+    _, still_running = await asyncio.wait(tasks, timeout=_CANCEL_TIMEOUT)
+    return still_running
+
+
+async def _cancel_and_drain_pending_tasks() -> tuple[
+    set[asyncio.Task], set[asyncio.Task]
+]:
+    unfinished_tasks = _cancel_pending_tasks(asyncio.get_running_loop())
+    return unfinished_tasks, await _wait_for_cancelled_tasks(unfinished_tasks)
+
 
 def _error_and_kill_pending_tasks(
     loop: asyncio.AbstractEventLoop, test_name: str, test_passed: bool
@@ -98,18 +138,40 @@ def _error_and_kill_pending_tasks(
         set[asyncio.Task]: The set of unfinished tasks that were cancelled.
 
     Raises:
-        RuntimeError: If there are unfinished tasks and the test didn't fail.
+        RuntimeError: If there are unfinished tasks and the test didn't fail, or
+            if any of them are still running after being cancelled.
     """
-    unfinished_tasks = {
-        task
-        for task in asyncio.all_tasks(loop)
-        if (coro := task.get_coro()) is not None
-        and hasattr(coro, "__name__")
-        and coro.__name__ not in _ALLOWED_PYTEST_TASKS
-        and not task.done()
-    }
-    for task in unfinished_tasks:
-        task.cancel()
+    # Let the cancellations be delivered now, rather than leaving them pending
+    # for whoever runs the loop next
+    if loop.is_running():
+        # The loop is running in another thread, so cancel and drain there
+        future = asyncio.run_coroutine_threadsafe(
+            _cancel_and_drain_pending_tasks(), loop
+        )
+        try:
+            # Allow for the loop being busy as well as the wait for the tasks
+            unfinished_tasks, still_running = future.result(timeout=_CANCEL_TIMEOUT * 2)
+        except TimeoutError as exc:
+            future.cancel()
+            raise RuntimeError(
+                f"Event loop didn't respond while cancelling tasks at the end of "
+                f"test {test_name}"
+            ) from exc
+    else:
+        unfinished_tasks = _cancel_pending_tasks(loop)
+        still_running: set[asyncio.Task] = set()
+        if unfinished_tasks and not loop.is_closed():
+            still_running = loop.run_until_complete(
+                _wait_for_cancelled_tasks(unfinished_tasks)
+            )
+
+    # Always report tasks that ignored cancellation, as they will carry on
+    # running into later tests
+    if still_running:
+        raise RuntimeError(
+            f"Tasks still running after being cancelled at the end of test "
+            f"{test_name}:\n{pprint.pformat(still_running, width=88)}"
+        )
 
     # We only raise an exception here if the test didn't fail anyway.
     # If it did then it makes sense that there's some tasks we need to cancel,
@@ -132,7 +194,8 @@ async def fail_test_on_unclosed_tasks(request: FixtureRequest):
         fail_count = request.session.testsfailed
         loop = asyncio.get_running_loop()
 
-        loop.set_debug(True)
+        if DEBUG_LOOP:
+            loop.set_debug(True)
 
         request.addfinalizer(
             lambda: _error_and_kill_pending_tasks(
@@ -146,11 +209,31 @@ async def fail_test_on_unclosed_tasks(request: FixtureRequest):
             raise error
 
 
-@pytest.fixture(scope="function")
-def RE(request: FixtureRequest):
+@pytest.fixture(scope="session")
+def _run_engine_loop():
+    """Event loop shared by every `RE` in the session.
+
+    Starting a loop and its RunEngine thread for every test is slow, so do it
+    once and only make a fresh RunEngine per test.
+    """
     loop = asyncio.new_event_loop()
-    loop.set_debug(True)
-    RE = RunEngine({}, call_returns_result=True, loop=loop)
+    if DEBUG_LOOP:
+        loop.set_debug(True)
+    # The first RunEngine made with this loop starts it running in a thread.
+    # RunEngine only accepts a running loop if it started it, so we can't start
+    # the thread ourselves
+    yield loop
+    if loop.is_running():
+        loop.call_soon_threadsafe(loop.stop)
+        deadline = time.monotonic() + _CANCEL_TIMEOUT
+        while loop.is_running() and time.monotonic() < deadline:
+            time.sleep(0.01)
+    loop.close()
+
+
+@pytest.fixture(scope="function")
+def RE(request: FixtureRequest, _run_engine_loop: asyncio.AbstractEventLoop):
+    RE = RunEngine({}, call_returns_result=True, loop=_run_engine_loop)
     fail_count = request.session.testsfailed
 
     def clean_event_loop():
@@ -160,15 +243,11 @@ def RE(request: FixtureRequest):
             except TransitionError:
                 pass
 
-        loop.call_soon_threadsafe(loop.stop)
-        RE._th.join()
-
-        try:
-            _error_and_kill_pending_tasks(
-                loop, request.node.name, request.session.testsfailed == fail_count
-            )
-        finally:
-            loop.close()
+        _error_and_kill_pending_tasks(
+            _run_engine_loop,
+            request.node.name,
+            request.session.testsfailed == fail_count,
+        )
 
     request.addfinalizer(clean_event_loop)
     return RE
@@ -363,5 +442,5 @@ def bl01t_di_cam_01(ca_gateway, docker_composer):
         yield from docker_composer(
             ["-f", f"{example_services_path}/compose.yaml"],
             docker_services="bl01t-di-cam-01",
-            ready_log_line="iocRun: All initialization complete",
+            ready_log_line=IOC_READY_MARKER,
         )
@@ -16,6 +16,7 @@ from ophyd_async.core import (
     init_devices,
 )
 from ophyd_async.epics.core import epics_signal_rw
+from ophyd_async.epics.testing import IOC_READY_MARKER
 from ophyd_async.fastcs.eiger import EigerDetector
 
 SAVE_PATH = "/tmp"
@@ -30,6 +31,27 @@ env["eiger_ioc"] = _eiger_ioc
 env["odin_ioc"] = _odin_ioc
 
 
+def _wait_for_ioc_ready(container: str, timeout: float = 30.0):
+    """Poll the container's logs until the IOC inside reports it has started."""
+    deadline = time.monotonic() + timeout
+    output = ""
+    while time.monotonic() < deadline:
+        # This fails until the container exists, which is fine, we keep polling
+        logs = subprocess.run(
+            ["docker", "logs", container], capture_output=True, text=True, env=env
+        )
+        output = logs.stdout + logs.stderr
+        if IOC_READY_MARKER in output:
+            return
+        time.sleep(0.1)
+    # Show the end of the logs, so a changed ready line is easy to spot
+    tail = "\n".join(output.splitlines()[-20:])
+    raise TimeoutError(
+        f"IOC in container {container} didn't print {IOC_READY_MARKER!r} "
+        f"within {timeout}s, last output was:\n{tail}"
+    )
+
+
 class SetupDevice(Device):
     """Holds PVs that we would either expect to be initially set and
     never change or to be externally set in prod.
@@ -62,8 +84,7 @@ def eiger_ioc():
         env=env,
     )
     try:
-        # wait for IOC to be ready (sleep or poll)
-        time.sleep(1)
+        _wait_for_ioc_ready(_eiger_ioc)
         yield
     finally:
         # Cleanup: terminate the IOC process
@@ -84,8 +105,7 @@ def odin_ioc():
         env=env,
     )
     try:
-        # wait for IOC to be ready (sleep or poll)
-        time.sleep(1)
+        _wait_for_ioc_ready(_odin_ioc)
         yield
     finally:
         # Cleanup: terminate the IOC process
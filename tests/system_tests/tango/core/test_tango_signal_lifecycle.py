@@ -60,13 +60,11 @@ scenario (`tests/system_tests/epics/signal/test_signals.py`'s
 `ioc_devices` fixture + `assert_monitor_then_put`'s `await signal.connect
 (timeout=1)`): construct the (unconnected) device *once*, in a plain
 *synchronous* `scope="module"` fixture, then `await device.connect()`
-inside each test as before. `Device.connect()` caches its result in an
-`asyncio.Task` (`self._connect_task`, `src/ophyd_async/core/_device.py`) -
-once that task is done, every later `.connect()` call just re-awaits the
-same completed task, which is safe from a different test's event loop:
-awaiting an already-done `asyncio.Task`/`Future` never touches the loop it
-was created on (`Task.__await__` returns `self.result()` immediately
-without yielding). So only the *first* parametrized case actually pays
+inside each test as before. `Device.connect()` caches a successful
+connect (`self._connected`, `src/ophyd_async/core/_device.py`) - once it
+has succeeded, every later `.connect()` call returns straight away without
+creating or awaiting a task, which is safe from a different test's event
+loop. So only the *first* parametrized case actually pays
 the connect/discovery cost; the rest are cache hits. This avoids
 pytest-asyncio's `loop_scope="module"` entirely (an earlier attempt using
 it broke CI - see this PR's commit history for why), so it doesn't need
@@ -1,8 +1,9 @@
 import asyncio
 import os
+import sys
 import time
 import traceback
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, call
 
 import pytest
 
@@ -15,9 +16,12 @@ from ophyd_async.core import (
     NotConnectedError,
     Reference,
     SignalRW,
+    SoftSignalBackend,
+    get_mock,
     init_devices,
     soft_signal_rw,
     wait_for_connection,
+    wait_for_connection_pairs,
 )
 from ophyd_async.core._device import DEVICE_RESERVED_ATTRS  # noqa: PLC2701
 from ophyd_async.epics import motor
@@ -168,6 +172,15 @@ def test_device_vector_children():
     ]
 
 
+def test_device_vector_children_updated_on_mutation():
+    vector = DeviceVector({1: DummyBaseDevice()})
+    assert [name for name, _ in vector.children()] == ["1"]
+    vector[2] = DummyBaseDevice()
+    assert [name for name, _ in vector.children()] == ["1", "2"]
+    del vector[1]
+    assert [name for name, _ in vector.children()] == ["2"]
+
+
 async def test_children_of_device_have_set_names_and_get_connected(
     parent: DummyDeviceGroup,
 ):
@@ -245,6 +258,18 @@ async def test_wait_for_connection_propagates_error(
         assert traceback.extract_tb(exc.__traceback__)[-1].name == "failing_coroutine"
 
 
+async def test_wait_for_connection_pairs_names_failures(
+    normal_coroutine, failing_coroutine
+):
+    coro, is_running = normal_coroutine
+    pairs = [("test", coro()), ("failing", failing_coroutine())]
+
+    with pytest.raises(NotConnectedError) as exc:
+        await wait_for_connection_pairs(pairs)
+    assert is_running.is_set()
+    assert list(exc.value.sub_errors) == ["failing"]
+
+
 async def test_device_log_has_correct_name():
     device = DummyBaseDevice()
     assert device.log.extra["ophyd_async_device_name"] == ""
@@ -333,6 +358,53 @@ async def test_no_reconnect_signals_if_not_forced():
         assert parent.child1.connect.call_count == count
 
 
+class CountingConnectBackend(SoftSignalBackend[int]):
+    def __init__(self):
+        super().__init__(int)
+        self.connect_count = 0
+
+    async def connect(self, timeout: float):
+        self.connect_count += 1
+        await asyncio.sleep(0)
+
+
+async def test_connect_after_connect_task_finishes_does_not_reconnect():
+    backend = CountingConnectBackend()
+    signal = SignalRW(backend)
+    first_connect = asyncio.create_task(signal.connect())
+    # There is no public way to tell the connect has finished before the
+    # awaiting caller has resumed, so look at the Task directly
+    while signal._connect_task is None or not signal._connect_task.done():
+        await asyncio.sleep(0)
+    await signal.connect()
+    await first_connect
+    assert backend.connect_count == 1
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="Eager tasks need 3.12")
+async def test_connect_that_does_not_suspend_finishes_on_first_step():
+    signal = soft_signal_rw(int)
+    coro = signal.connect()
+    # A soft Signal's connect never suspends, so the eager connect Task is
+    # done as soon as it is created, and connect() returns without yielding
+    try:
+        with pytest.raises(StopIteration):
+            coro.send(None)
+    finally:
+        coro.close()
+    # There is no public way to see the cached connect, so look at it directly
+    assert signal._connected
+
+
+async def test_mock_reconnect_gives_children_fresh_mocks():
+    device = DeviceWithNamedChild("device")
+    await device.connect(mock=True)
+    await device.child.set(1)
+    assert get_mock(device.child).mock_calls == [call.put(1)]
+    await device.connect(mock=True)
+    assert get_mock(device.child).mock_calls == []
+
+
 def test_setitem_with_non_int_key():
     device_vector = DeviceVector(children={})
     with pytest.raises(TypeError, match="Expected int, got"):
@@ -1,5 +1,7 @@
 import asyncio
+import gc
 import re
+import weakref
 from unittest.mock import AsyncMock, MagicMock, call
 
 import pytest
@@ -445,3 +447,20 @@ async def test_when_async_callback_returns_none_then_readback_is_the_setpoint():
 
     await mock_signal.set(5)
     assert (await mock_signal.get_value()) == 5
+
+
+async def test_mock_connected_device_is_not_kept_alive():
+    class MyDevice(Device):
+        def __init__(self, name: str = ""):
+            self.signal = epics_signal_rw(int, "PV")
+            super().__init__(name)
+
+    device = MyDevice("device")
+    await device.connect(mock=True)
+    set_mock_value(device.signal, 1)
+    await device.signal.set(2)
+    device_ref, signal_ref = weakref.ref(device), weakref.ref(device.signal)
+    del device
+    gc.collect()
+    assert device_ref() is None
+    assert signal_ref() is None
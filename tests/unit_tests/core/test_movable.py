@@ -1,4 +1,3 @@
-import asyncio
 from functools import cached_property
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -115,7 +114,8 @@ async def test_movable_moving_stopped(movable: StandardMovableImpl):
     set_mock_put_proceeds(movable.setpoint, False)
     move_status = movable.set(1.5)
     move_status.add_callback(Mock())
-    await asyncio.sleep(0.0001)
+    # Let set() get as far as the blocked put, so stop() has a move to cancel
+    await wait_for_pending_wakeups()
 
     assert not move_status.done
     await movable.stop()
@@ -151,6 +151,54 @@ async def test_signal_connects_with_force_reconnect(caplog):
     assert num_occurrences(f"Connecting to {signal.source}", caplog.text) == 2
 
 
+class SlowConnectBackend(SoftSignalBackend[int]):
+    def __init__(self, in_flight: list[int]):
+        super().__init__(int)
+        self.in_flight = in_flight
+
+    async def connect(self, timeout: float):
+        # Record how many connects are in progress, including this one
+        self.in_flight.append(self.in_flight[-1] + 1)
+        await asyncio.sleep(0.01)
+        self.in_flight.append(self.in_flight[-1] - 1)
+
+
+@pytest.mark.parametrize("limit", [None, 1, 2])
+async def test_signal_connects_limited_by_concurrency_env(
+    limit: int | None, monkeypatch: pytest.MonkeyPatch
+):
+    if limit is not None:
+        monkeypatch.setenv("OPHYD_ASYNC_CONNECT_CONCURRENCY", str(limit))
+    in_flight = [0]
+    signals = [SignalRW(SlowConnectBackend(in_flight)) for _ in range(4)]
+    await asyncio.gather(*(signal.connect() for signal in signals))
+    assert max(in_flight) == (limit or len(signals))
+    assert in_flight[-1] == 0
+
+
+class DeviceWithTwoSignals(Device):
+    def __init__(self, name: str = ""):
+        self.a = soft_signal_rw(int)
+        self.b = soft_signal_rw(int)
+        super().__init__(name)
+
+
+@pytest.mark.parametrize("limit_str", ["0", "-1", "abc"])
+async def test_device_connect_rejects_bad_concurrency_env(
+    limit_str: str, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("OPHYD_ASYNC_CONNECT_CONCURRENCY", limit_str)
+    match = f"should be a positive integer, got {limit_str!r}"
+    # Raised directly rather than wrapped in a NotConnectedError per Signal
+    with pytest.raises(ValueError, match=match):
+        await DeviceWithTwoSignals().connect()
+    with pytest.raises(ValueError, match=match):
+        async with init_devices():
+            device = DeviceWithTwoSignals()
+    # Mock connects don't use the limit, so aren't affected
+    await device.connect(mock=True)
+
+
 async def time_taken_by(coro) -> float:
     start = time.monotonic()
     await coro
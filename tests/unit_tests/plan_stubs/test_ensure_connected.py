@@ -28,7 +28,7 @@ def test_ensure_connected(RE):
 
     device1.signal = soft_signal_rw(str)
     RE(connect())
-    assert device1.signal._connect_task.exception() is None
+    assert device1.signal._connect_task is None
 
     device2 = MyDevice("PREFIX2", name="device2")
 